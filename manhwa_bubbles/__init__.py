@@ -13,6 +13,11 @@ from .speech_bubbles import (
     bubble_glow, 
     bubble_scratchy
 )
+from .tails import (
+    speaker_tail,
+    connect_bubbles,
+    tail_anchor
+)
 from .narrators import (
     narrator_plain,
     narrator_borderless, 
@@ -20,6 +25,12 @@ from .narrators import (
     narrator_dark,
     narrator_wavy
 )
+from .render import (
+    RenderContext,
+    default_context,
+    render_page,
+    render_pages
+)
 
 __version__ = "1.1.0"
 __author__ = "Ihor Oderii"
@@ -32,9 +43,16 @@ __all__ = [
     'bubble_spiky', 
     'bubble_glow',
     'bubble_scratchy',
+    'speaker_tail',
+    'connect_bubbles',
+    'tail_anchor',
     'narrator_plain',
     'narrator_borderless',
     'narrator_dashed', 
     'narrator_dark',
-    'narrator_wavy'
+    'narrator_wavy',
+    'RenderContext',
+    'default_context',
+    'render_page',
+    'render_pages'
 ]
\ No newline at end of file
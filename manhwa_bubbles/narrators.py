@@ -5,7 +5,7 @@ Narrator box functions for manhwa-style comics.
 from PIL import ImageDraw, ImageFont
 
 
-def narrator_plain(draw, xy, text):
+def narrator_plain(draw, xy, text, font=None):
     """
     Plain rectangular narration box.
     
@@ -13,14 +13,15 @@ def narrator_plain(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for box position and size
         text: Text to display in the narration box
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     draw.rectangle((x, y, x+w, y+h), fill="white", outline="black", width=2)
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="black")
 
 
-def narrator_borderless(draw, xy, text):
+def narrator_borderless(draw, xy, text, font=None):
     """
     Borderless floating narration (just text).
     
@@ -28,13 +29,14 @@ def narrator_borderless(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for text position and size
         text: Text to display
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x, y), text, font=font, fill="black")
 
 
-def narrator_dashed(draw, xy, text):
+def narrator_dashed(draw, xy, text, font=None):
     """
     Dashed border narration box.
     
@@ -42,6 +44,7 @@ def narrator_dashed(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for box position and size
         text: Text to display in the narration box
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     # Dashed rectangle (drawn manually)
@@ -53,11 +56,11 @@ def narrator_dashed(draw, xy, text):
         draw.line((x, j, x, min(j+5, y+h)), fill="black", width=2)  # left
         draw.line((x+w, j, x+w, min(j+5, y+h)), fill="black", width=2)  # right
     draw.rectangle((x, y, x+w, y+h), fill="white")
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="black")
 
 
-def narrator_dark(draw, xy, text):
+def narrator_dark(draw, xy, text, font=None):
     """
     Dark/ominous narration box.
     
@@ -65,14 +68,15 @@ def narrator_dark(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for box position and size
         text: Text to display in the narration box
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     draw.rectangle((x, y, x+w, y+h), fill="black", outline="white", width=2)
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="white")
 
 
-def narrator_wavy(draw, xy, text):
+def narrator_wavy(draw, xy, text, font=None):
     """
     Wavy border narration box (dreamy/unstable).
     
@@ -80,6 +84,7 @@ def narrator_wavy(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for box position and size
         text: Text to display in the narration box
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     step = 10
@@ -101,5 +106,5 @@ def narrator_wavy(draw, xy, text):
     draw.line(path_right, fill="black", width=2)
     # fill background
     draw.rectangle((x, y, x+w, y+h), fill="white")
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="black")
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Render context and threaded page rendering for manhwa-style comics.
+
+A RenderContext bundles what the drawing functions would otherwise look up
+globally (fonts, the style registry) so one context can be shared read-only
+by every worker of a ThreadPoolExecutor. Each thread draws on its own image.
+Drawing is mostly Python geometry and Pillow calls that hold the GIL; image
+encoding releases it, so workers that also encode their page can overlap.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+import io
+import threading
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .speech_bubbles import speech_bubble
+from .narrators import (
+    narrator_plain,
+    narrator_borderless,
+    narrator_dashed,
+    narrator_dark,
+    narrator_wavy
+)
+
+
+BUBBLE_TYPES = [
+    "oval", "rect", "cloud", "jagged", "wavy",
+    "black", "heart", "spiky", "glow", "scratchy"
+]
+
+DEFAULT_STYLES = {
+    bubble_type: partial(speech_bubble, bubble_type=bubble_type)
+    for bubble_type in BUBBLE_TYPES
+}
+DEFAULT_STYLES.update({
+    "narrator_plain": narrator_plain,
+    "narrator_borderless": narrator_borderless,
+    "narrator_dashed": narrator_dashed,
+    "narrator_dark": narrator_dark,
+    "narrator_wavy": narrator_wavy,
+})
+
+
+class RenderContext:
+    """
+    Read-only rendering state that is safe to share across threads.
+
+    Fonts are loaded lazily once per thread, since PIL font objects wrap
+    FreeType faces that must not be used by two threads at the same time.
+    The style registry is frozen at construction.
+
+    Tail geometry is deliberately not part of the context: it stays in the
+    process-wide cache in manhwa_bubbles.tails. Its keys are plain geometry
+    values, its entries are immutable tuples and lru_cache guards its own
+    bookkeeping, so every context and thread can share it and reuse the
+    same flattened curves.
+
+    Args:
+        font_loader: Callable returning a PIL font, called once per thread
+        styles: Optional mapping of style name to drawing function, defaults
+            to every speech bubble type and narrator box. Each function is
+            called as fn(draw, xy, text, font=font, **options) and must
+            accept the font keyword
+    """
+
+    def __init__(self, font_loader=ImageFont.load_default, styles=None):
+        self._font_loader = font_loader
+        self._styles = MappingProxyType(dict(DEFAULT_STYLES if styles is None else styles))
+        self._local = threading.local()
+
+    @property
+    def styles(self):
+        """Read-only mapping of style name to drawing function."""
+        return self._styles
+
+    def font(self):
+        """Returns this thread's font, loading it on first use."""
+        font = getattr(self._local, "font", None)
+        if font is None:
+            font = self._font_loader()
+            self._local.font = font
+        return font
+
+    def draw(self, draw, style, xy, text, **options):
+        """
+        Draws one registered style with this context's font.
+
+        Args:
+            draw: PIL ImageDraw object
+            style: Registered style name (e.g. "oval", "narrator_dark")
+            xy: Tuple of (x, y, width, height) for position and size
+            text: Text to display
+            **options: Extra keyword arguments for the style function
+        """
+        if style not in self._styles:
+            raise ValueError(f"Unknown style: {style!r}")
+        self._styles[style](draw, xy, text, font=self.font(), **options)
+
+
+default_context = RenderContext()
+
+
+def render_page(page, context=None, format=None):
+    """
+    Renders one page description to a new image.
+
+    Args:
+        page: Dict with "size" (width, height), "elements" and an optional
+            "background" color. Each element is a tuple of
+            (style, xy, text) or (style, xy, text, options)
+        context: RenderContext to draw with, defaults to default_context
+        format: Optional image format (e.g. "PNG") to encode the page to
+
+    Returns:
+        PIL Image with every element drawn in order, or the encoded bytes
+        when format is given
+    """
+    context = context or default_context
+    img = Image.new("RGB", page["size"], page.get("background", "white"))
+    draw = ImageDraw.Draw(img)
+    for element in page["elements"]:
+        style, xy, text = element[:3]
+        options = element[3] if len(element) > 3 else {}
+        context.draw(draw, style, xy, text, **options)
+    if format is None:
+        return img
+    buffer = io.BytesIO()
+    img.save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def render_pages(pages, context=None, max_workers=None, format=None):
+    """
+    Renders several pages on a thread pool sharing one context.
+
+    Drawing holds the GIL, so returning plain images is no faster than a
+    serial loop. With format set, each worker also encodes its page, and
+    Pillow releases the GIL while encoding, so on a multi-core machine the
+    encoding of different pages runs in parallel.
+
+    Args:
+        pages: Iterable of page descriptions accepted by render_page
+        context: RenderContext shared by all workers, defaults to default_context
+        max_workers: Maximum number of threads, defaults to the executor default
+        format: Optional image format (e.g. "PNG") each worker encodes to
+
+    Returns:
+        List of PIL Images, or of encoded bytes when format is given, in the
+        same order as pages
+    """
+    context = context or default_context
+    worker = partial(render_page, context=context, format=format)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, pages))
@@ -5,8 +5,10 @@ Speech bubble functions for manhwa-style comics.
 from PIL import ImageDraw, ImageFont
 import math
 
+from .tails import speaker_tail
 
-def bubble_heart(draw, xy, text):
+
+def bubble_heart(draw, xy, text, font=None):
     """
     Heart-shaped bubble (romantic).
     
@@ -14,6 +16,7 @@ def bubble_heart(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for bubble position and size
         text: Text to display in the bubble
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     points = []
@@ -23,11 +26,11 @@ def bubble_heart(draw, xy, text):
         py = y + h//2 - int((13*math.cos(rad) - 5*math.cos(2*rad) - 2*math.cos(3*rad) - math.cos(4*rad)) * (h/20))
         points.append((px, py))
     draw.polygon(points, fill="white", outline="red", width=3)
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+w//3, y+h//3), text, font=font, fill="red")
 
 
-def bubble_spiky(draw, xy, text):
+def bubble_spiky(draw, xy, text, font=None):
     """
     Spiky flame-like bubble (rage).
     
@@ -35,6 +38,7 @@ def bubble_spiky(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for bubble position and size
         text: Text to display in the bubble
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     points = []
@@ -46,11 +50,11 @@ def bubble_spiky(draw, xy, text):
         py = y+h//2 + int(r*math.sin(angle))
         points.append((px, py))
     draw.polygon(points, fill="white", outline="black")
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+w//3, y+h//3), text, font=font, fill="black")
 
 
-def bubble_glow(draw, xy, text):
+def bubble_glow(draw, xy, text, font=None):
     """
     Bubble with glowing aura (magic/divine).
     
@@ -58,16 +62,17 @@ def bubble_glow(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for bubble position and size
         text: Text to display in the bubble
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     for r in range(0, 20, 4):
         draw.ellipse((x-r, y-r, x+w+r, y+h+r), outline="yellow", width=2)
     draw.ellipse((x, y, x+w, y+h), fill="white", outline="gold", width=3)
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="black")
 
 
-def bubble_scratchy(draw, xy, text):
+def bubble_scratchy(draw, xy, text, font=None):
     """
     Scratchy/rough border bubble (madness/creepy).
     
@@ -75,6 +80,7 @@ def bubble_scratchy(draw, xy, text):
         draw: PIL ImageDraw object
         xy: Tuple of (x, y, width, height) for bubble position and size
         text: Text to display in the bubble
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     for i in range(100):
@@ -84,7 +90,7 @@ def bubble_scratchy(draw, xy, text):
         py2 = py1 + (math.cos(i*5)*10)
         draw.line((px1, py1, px2, py2), fill="black", width=1)
     draw.rectangle((x, y, x+w, y+h), fill="white")
-    font = ImageFont.load_default()
+    font = font or ImageFont.load_default()
     draw.text((x+10, y+10), text, font=font, fill="black")
 
 
@@ -108,7 +114,8 @@ def draw_tail(draw, x, y, direction="down"):
     draw.polygon(points, fill="white", outline="black")
 
 
-def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down"):
+def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down",
+                  speaker=None, tail_style="straight", font=None):
     """
     Draws different manhwa bubble types.
     
@@ -118,9 +125,13 @@ def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down"):
         text: Text to display in the bubble
         bubble_type: Type of bubble ("oval", "rect", "cloud", "jagged", "wavy", "black", "heart", "spiky", "glow", "scratchy")
         tail_dir: Direction for the speech tail ("down", "up", "left", "right")
+        speaker: Optional (x, y) the tail points at instead of using tail_dir
+        tail_style: Style of a speaker tail ("straight" or "curved")
+        font: Optional PIL font, defaults to the built-in font
     """
     x, y, w, h = xy
     text_color = "black"  # default
+    tail_shape = "oval"  # outline a speaker tail attaches to
 
     if bubble_type == "oval":  # normal speech
         draw.ellipse((x, y, x+w, y+h), fill="white", outline="black", width=3)
@@ -129,11 +140,13 @@ def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down"):
         draw.rectangle((x, y, x+w, y+h), fill="white", outline="black", width=3)
 
     elif bubble_type == "cloud":  # thought
+        tail_shape = [("ellipse", (x, y, x+w, y+h))]
         for i in range(12):
             angle = 2*math.pi*i/12
             cx = x+w//2 + int((w//2)*math.cos(angle))
             cy = y+h//2 + int((h//2)*math.sin(angle))
             draw.ellipse((cx-15, cy-15, cx+15, cy+15), fill="white", outline="black")
+            tail_shape.append(("ellipse", (cx-15, cy-15, cx+15, cy+15)))
         draw.ellipse((x, y, x+w, y+h), fill="white", outline="black")
 
     elif bubble_type == "jagged":  # shouting
@@ -146,6 +159,7 @@ def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down"):
             py = y+h//2 + int(r*math.sin(angle))
             points.append((px, py))
         draw.polygon(points, fill="white", outline="black")
+        tail_shape = [("polygon", points)]
 
     elif bubble_type == "wavy":  # nervous/shaky
         steps = 20
@@ -162,26 +176,32 @@ def speech_bubble(draw, xy, text, bubble_type="oval", tail_dir="down"):
         text_color = "white"
         
     elif bubble_type == "heart":  # romantic
-        bubble_heart(draw, xy, text)
+        bubble_heart(draw, xy, text, font=font)
         return  # heart bubble handles its own text
         
     elif bubble_type == "spiky":  # rage/flame
-        bubble_spiky(draw, xy, text)
+        bubble_spiky(draw, xy, text, font=font)
         return  # spiky bubble handles its own text
         
     elif bubble_type == "glow":  # magic/divine
-        bubble_glow(draw, xy, text)
+        bubble_glow(draw, xy, text, font=font)
         return  # glow bubble handles its own text
         
     elif bubble_type == "scratchy":  # madness/creepy
-        bubble_scratchy(draw, xy, text)
+        bubble_scratchy(draw, xy, text, font=font)
         return  # scratchy bubble handles its own text
 
     # Tail (skip for special bubbles that handle their own rendering)
     if bubble_type not in ["rect", "wavy", "heart", "spiky", "glow", "scratchy"]:
-        draw_tail(draw, x+w//2, y+h, direction=tail_dir)
+        if speaker is not None:
+            fill, outline = ("black", "white") if bubble_type == "black" else ("white", "black")
+            width = 3 if bubble_type in ["oval", "black"] else 1
+            speaker_tail(draw, xy, speaker, shape=tail_shape, style=tail_style,
+                         fill=fill, outline=outline, width=width)
+        else:
+            draw_tail(draw, x+w//2, y+h, direction=tail_dir)
 
     # Add text (skip for special bubbles that handle their own text)
     if bubble_type not in ["heart", "spiky", "glow", "scratchy"]:
-        font = ImageFont.load_default()
+        font = font or ImageFont.load_default()
         draw.text((x+10, y+10), text, font=font, fill=text_color)
\ No newline at end of file
@@ -79,6 +79,170 @@ def test_all_bubble_types():
         return False
 
 
+def test_speaker_tails():
+    """Test speaker tails, curved tails and connectors reuse cached geometry."""
+    try:
+        import math
+        import random
+        from PIL import Image, ImageDraw
+        from manhwa_bubbles import speech_bubble, speaker_tail, connect_bubbles, tail_anchor
+        from manhwa_bubbles.tails import _tail_geometry
+        
+        # Anchors sit on the outline along the line to the speaker
+        assert tail_anchor((0, 0, 100, 50), (50, 200)) == (50, 50)
+        assert tail_anchor((0, 0, 100, 50), (300, 25), shape="rect") == (100, 25)
+        
+        img = Image.new("RGB", (600, 400), "lightblue")
+        draw = ImageDraw.Draw(img)
+        
+        speech_bubble(draw, (50, 50, 160, 80), "Over here", "oval", speaker=(40, 300))
+        speech_bubble(draw, (300, 50, 160, 80), "Curved", "black",
+                      speaker=(500, 300), tail_style="curved")
+        speech_bubble(draw, (50, 200, 120, 60), "First...", "oval")
+        speech_bubble(draw, (250, 220, 120, 60), "...second", "oval")
+        connect_bubbles(draw, (50, 200, 120, 60), (250, 220, 120, 60))
+        
+        # The tail tip reaches the speaker
+        assert img.getpixel((40, 298)) != (173, 216, 230)
+        
+        # The connector bridges the gap between the two bubbles
+        ax, ay = tail_anchor((50, 200, 120, 60), (310, 250))
+        bx, by = tail_anchor((250, 220, 120, 60), (110, 230))
+        assert img.getpixel((round((ax + bx) / 2), round((ay + by) / 2))) == (255, 255, 255)
+        
+        # Overlapping bubbles have nothing to bridge
+        blank = Image.new("RGB", (300, 200), "lightblue")
+        connect_bubbles(ImageDraw.Draw(blank), (20, 20, 120, 60), (100, 50, 120, 60))
+        assert blank.tobytes() == Image.new("RGB", (300, 200), "lightblue").tobytes()
+        
+        # Tails towards many different speakers share the cached curves
+        rng = random.Random(0)
+        scratch = ImageDraw.Draw(Image.new("RGB", (760, 480), "white"))
+        _tail_geometry.cache_clear()
+        for _ in range(500):
+            angle = rng.uniform(0, 2*math.pi)
+            reach = rng.uniform(60, 200)
+            speaker = (380 + reach*math.cos(angle), 240 + reach*math.sin(angle))
+            speaker_tail(scratch, (340, 220, 80, 40), speaker,
+                         style=rng.choice(["straight", "curved"]))
+        info = _tail_geometry.cache_info()
+        assert info.misses <= 200 and info.hits >= 300, info
+        
+        # Unknown tail styles are rejected instead of drawing a straight tail
+        try:
+            speaker_tail(draw, (50, 50, 160, 80), (40, 300), style="curvy")
+            raise AssertionError("unknown tail style was accepted")
+        except ValueError:
+            pass
+        
+        img.save("speaker_tails_test.png")
+        print("✅ Speaker tails test passed!")
+        print("✅ Speaker tails image saved as 'speaker_tails_test.png'")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Speaker tails test failed: {e!r}")
+        return False
+
+
+def _color_mask(img, color):
+    """Returns an L mask that is 255 where img has exactly the given color."""
+    from PIL import Image, ImageChops
+    diff = ImageChops.difference(img, Image.new("RGB", img.size, color))
+    return diff.convert("L").point(lambda v: 255 if v == 0 else 0)
+
+
+def test_tail_outlines():
+    """Test tails never stroke the bubble interior and never open its outline."""
+    try:
+        import math
+        from PIL import Image, ImageChops, ImageDraw, ImageFilter
+        from manhwa_bubbles import speech_bubble
+        
+        background, marker = (173, 216, 230), (255, 0, 0)
+        colors = {"oval": ("white", "black"), "black": ("black", "white"),
+                  "cloud": ("white", "black"), "jagged": ("white", "black")}
+        xy = (170, 130, 160, 80)
+        center = (250, 170)
+        
+        for bubble_type, (fill, outline) in colors.items():
+            # Without a tail (speaker at the center) to find the interior and
+            # any background pixels the bubble itself traps (between cloud puffs)
+            plain = Image.new("RGB", (500, 420), background)
+            speech_bubble(ImageDraw.Draw(plain), xy, "", bubble_type, speaker=center)
+            interior = _color_mask(plain, fill).filter(ImageFilter.MinFilter(7))
+            trapped = plain.copy()
+            ImageDraw.floodfill(trapped, (0, 0), marker)
+            trapped = _color_mask(trapped, background)
+            
+            for tail_style in ["straight", "curved"]:
+                for k in range(12):
+                    angle = 2*math.pi*k/12 + 0.2
+                    speaker = (250 + 220*math.cos(angle), 210 + 190*math.sin(angle))
+                    img = Image.new("RGB", (500, 420), background)
+                    speech_bubble(ImageDraw.Draw(img), xy, "", bubble_type,
+                                  speaker=speaker, tail_style=tail_style)
+                    case = f"{bubble_type}/{tail_style}/{k}"
+                    
+                    # No tail edge stroke runs through the bubble interior
+                    strokes = ImageChops.multiply(_color_mask(img, outline), interior)
+                    assert strokes.getbbox() is None, f"stroke inside bubble: {case}"
+                    
+                    # The bubble and tail fill never touch the background outside
+                    ImageDraw.floodfill(img, center, marker)
+                    filled = _color_mask(img, marker)
+                    outside = ImageChops.subtract(_color_mask(img, background), trapped)
+                    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                        touching = ImageChops.multiply(ImageChops.offset(filled, dx, dy), outside)
+                        assert touching.getbbox() is None, f"outline gap: {case}"
+        
+        print("✅ Tail outlines test passed!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Tail outlines test failed: {e!r}")
+        return False
+
+
+def test_threaded_rendering():
+    """Test pages rendered on a thread pool match a serial render byte for byte."""
+    try:
+        from manhwa_bubbles import RenderContext, render_page, render_pages
+        
+        context = RenderContext()
+        styles = sorted(context.styles)
+        pages = []
+        for p in range(32):
+            elements = []
+            for i in range(12):
+                style = styles[(p + i) % len(styles)]
+                xy = (20 + (i % 4) * 180, 30 + (i // 4) * 170, 140, 90)
+                options = {}
+                if style == "oval":
+                    options = {"speaker": (xy[0] + p % 7 * 20, xy[1] + 150), "tail_style": "curved"}
+                elements.append((style, xy, f"Page {p} line {i}", options))
+            pages.append({"size": (760, 560), "background": "lightblue", "elements": elements})
+        
+        serial = [render_page(page, context) for page in pages]
+        threaded = render_pages(pages, context, max_workers=8)
+        
+        assert len(threaded) == len(serial)
+        for expected, actual in zip(serial, threaded):
+            assert expected.tobytes() == actual.tobytes()
+        
+        # Workers that encode their own page return the same PNG bytes
+        encoded = render_pages(pages, context, max_workers=8, format="PNG")
+        assert encoded == [render_page(page, context, format="PNG") for page in pages]
+        
+        print("✅ Threaded rendering test passed!")
+        print(f"✅ Rendered {len(pages)} pages concurrently, identical to serial output and PNG bytes")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Threaded rendering test failed: {e!r}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("Testing Manhwa Bubbles Library")
@@ -87,7 +251,10 @@ def main():
     tests = [
         test_import,
         test_basic_functionality,
-        test_all_bubble_types
+        test_all_bubble_types,
+        test_speaker_tails,
+        test_tail_outlines,
+        test_threaded_rendering
     ]
     
     passed = 0